@@ -58,6 +58,12 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "synapse_secret"
+    # Bolt connection pool. Ingestion fans out EXTRACTION_CONCURRENCY writers
+    # while chat traffic reads concurrently — size the pool for both and fail
+    # acquisition fast enough that a saturated pool surfaces as an error, not
+    # an unbounded queue of waiting requests.
+    neo4j_max_connection_pool_size: int = 50
+    neo4j_connection_acquisition_timeout: float = 30.0
 
     # ── LLM provider selection ───────────────────────────
     # Which chat model backend to use for extraction + chat.
@@ -184,6 +190,11 @@ class Settings(BaseSettings):
     # ── GraphRAG brain: retrieval ────────────────────────
     # Hops to expand from each seed entity (2 enables multi-hop reasoning paths).
     retrieval_max_hops: int = 2
+    # Retrieval results are cached in-process (keyed by the normalized question)
+    # so repeated or follow-up questions skip the Neo4j round-trips entirely.
+    # Entries expire after the TTL; either value at 0 disables the cache.
+    retrieval_cache_max_entries: int = 256
+    retrieval_cache_ttl_seconds: float = 60.0
     # Route thematic/aggregate questions to community summaries ("global search")
     # instead of entity neighborhoods ("local search").
     query_routing_enabled: bool = True
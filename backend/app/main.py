@@ -27,6 +27,7 @@ from app.config import get_settings  # noqa: E402
 from app.neo4j_driver import close_driver, get_driver, verify_connectivity  # noqa: E402
 from app.routers import chat, graph, upload  # noqa: E402
 from app.services.graph_schema import ensure_schema  # noqa: E402
+from app.services.llm_provider import get_chat_llm  # noqa: E402
 
 
 @asynccontextmanager
@@ -37,6 +38,15 @@ async def lifespan(app: FastAPI):
     await get_driver()
     logger.info("✅ Neo4j driver initialized")
     await ensure_schema()
+    # Warm the two chat clients (extraction + chat) so the first request reuses
+    # an established connection instead of paying client construction. Best
+    # effort: a missing key/SDK keeps its actionable error for first use.
+    try:
+        get_chat_llm(json_mode=True, temperature=settings.extraction_temperature)
+        get_chat_llm(streaming=True, temperature=settings.chat_temperature)
+        logger.info("✅ Chat model clients ready")
+    except Exception as e:  # noqa: BLE001 - the app must boot unconfigured
+        logger.warning("⚠️ Chat model warm-up skipped: %s", e)
     yield
     await close_driver()
     logger.info("🛑 Neo4j driver closed")
@@ -23,17 +23,46 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from app.neo4j_driver import execute_query
+from app.services.chat_engine import invalidate_retrieval_cache
 from app.services.communities import detect_and_summarize, get_community_summaries
 from app.services.jobs import job_bus
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# /graph-data projects directly in Cypher: rows arrive from the driver already
+# in the react-force-graph shape, so Python neither rebuilds a dict per node
+# nor receives embedding vectors it would only strip out again. ``label`` and
+# ``type`` fall back to the Neo4j label for nodes written before those
+# properties existed. The map projection emits its keys even when the property
+# is absent (as null) — the endpoint drops those in place before responding.
+_NODES_RETURN = """\
+RETURN toString(elementId(n)) AS id,
+       coalesce(n.name, head(labels(n)), 'Unknown') AS label,
+       coalesce(n.type, head(labels(n)), 'Unknown') AS type,
+       n {.name, .type, .description, .document, .aliases} AS properties"""
+
+_LINKS_RETURN = """\
+RETURN toString(elementId(a)) AS source, toString(elementId(b)) AS target,
+       coalesce(r.type, type(r)) AS type, properties(r) AS properties"""
+
 
 @router.get("/graph-data")
-async def get_graph_data():
+async def get_graph_data(
+    limit: int | None = Query(None, ge=1, le=5000),
+    offset: int = Query(0, ge=0),
+):
     """Fetch the ENTITY graph, formatted for react-force-graph.
 
+    Without parameters the whole graph is returned in one body (the existing
+    frontend contract). ``limit``/``offset`` page through the nodes instead —
+    ordered by name so pages are stable — with each page carrying the links
+    that *originate* from its nodes. Every edge therefore arrives exactly once
+    (on its source node's page), so walking the pages reassembles the complete
+    edge set; the price is that a link may briefly dangle toward a target the
+    client hasn't fetched yet. Filtering on both endpoints instead would drop
+    every cross-page edge permanently.
+
     Deliberately scoped to ``:Entity`` — on both ends of the relationship match,
     which is what keeps the non-entity nodes *and* their edges out:
 
@@ -48,43 +77,29 @@ async def get_graph_data():
     are surfaced by ``/api/communities``; source excerpts ride the chat
     endpoint's ``sources`` event instead.
     """
-    nodes_raw = await execute_query(
-        """
-        MATCH (n:Entity)
-        RETURN elementId(n) AS id, labels(n) AS labels, properties(n) AS properties
-        """
-    )
-    rels_raw = await execute_query(
-        """
-        MATCH (a:Entity)-[r]->(b:Entity)
-        RETURN elementId(a) AS source, elementId(b) AS target,
-               type(r) AS type, properties(r) AS properties
-        """
-    )
+    if limit is None:
+        nodes = await execute_query(f"MATCH (n:Entity)\n{_NODES_RETURN}")
+        links = await execute_query(
+            f"MATCH (a:Entity)-[r]->(b:Entity)\n{_LINKS_RETURN}"
+        )
+    else:
+        nodes = await execute_query(
+            f"MATCH (n:Entity)\n{_NODES_RETURN}\n"
+            "ORDER BY n.name SKIP $offset LIMIT $limit",
+            {"offset": offset, "limit": limit},
+        )
+        page_ids = [n["id"] for n in nodes]
+        links = await execute_query(
+            f"MATCH (a:Entity)-[r]->(b:Entity)\n"
+            f"WHERE elementId(a) IN $ids\n{_LINKS_RETURN}",
+            {"ids": page_ids},
+        )
 
-    nodes = [
-        {
-            "id": str(n["id"]),
-            "label": n["properties"].get("name", n["labels"][0] if n["labels"] else "Unknown"),
-            # Color by the domain `type` property (PERSON, TOOL, ...), not the
-            # Neo4j label (which is "Entity" for every node).
-            "type": n["properties"].get("type", n["labels"][0] if n["labels"] else "Unknown"),
-            # Never ship embedding vectors to the browser — large and useless there.
-            "properties": {k: v for k, v in n["properties"].items() if k != "embedding"},
-        }
-        for n in nodes_raw
-    ]
-
-    links = [
-        {
-            "source": str(r["source"]),
-            "target": str(r["target"]),
-            # Prefer the semantic type stored on the relationship, else the Neo4j type.
-            "type": r.get("properties", {}).get("type", r["type"]),
-            "properties": r.get("properties", {}),
-        }
-        for r in rels_raw
-    ]
+    # Strip the map projection's null entries in place — no per-node rebuild.
+    for node in nodes:
+        props = node["properties"]
+        for key in [k for k, v in props.items() if v is None]:
+            del props[key]
 
     return {"nodes": nodes, "links": links}
 
@@ -109,6 +124,9 @@ async def _rebuild_communities(job_id: str) -> None:
             await job_bus.publish(job_id, event)
 
         result = await detect_and_summarize(on_progress=on_progress)
+        # Global search answers from community summaries — fresh clusters make
+        # any cached retrieval stale.
+        invalidate_retrieval_cache()
 
         await job_bus.publish(job_id, {"type": "done", "data": result})
         logger.info(
@@ -153,6 +171,7 @@ async def clear_graph():
     """Delete all nodes and relationships in the database."""
     try:
         await execute_query("MATCH (n) DETACH DELETE n")
+        invalidate_retrieval_cache()
         return {"status": "success", "message": "Knowledge graph cleared"}
     except Exception as e:
         logger.error("Error clearing graph: %s", e)
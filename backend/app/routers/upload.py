@@ -16,14 +16,17 @@ themes the UI shows are then always in sync with the graph the user just built.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import tempfile
 from collections.abc import Awaitable, Callable
 
 from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 
 from app.config import get_settings
+from app.services.chat_engine import invalidate_retrieval_cache
 from app.services.communities import detect_and_summarize
 from app.services.graph_builder import build_knowledge_graph
 from app.services.jobs import job_bus
@@ -34,6 +37,12 @@ router = APIRouter()
 
 ProgressCallback = Callable[[dict], Awaitable[None]]
 
+# Uploads are streamed into a spool that lives in RAM up to this size and
+# silently overflows to disk beyond it, so a large PDF costs at most 10 MiB of
+# worker memory instead of its own full size.
+UPLOAD_SPOOL_MAX_MEMORY = 10 * 1024 * 1024
+UPLOAD_READ_CHUNK = 1 << 20
+
 
 async def _cluster_communities(on_progress: ProgressCallback) -> dict:
     """Re-detect + re-summarize communities as the last phase of an ingest.
@@ -82,6 +91,11 @@ async def _process_document(job_id: str, chunks: list[str], filename: str, theme
         )
 
         community_result = await _cluster_communities(on_progress)
+        # Invalidate only after the summaries are rewritten too: bumping the
+        # version between the graph write and the re-clustering would let a
+        # global-search answer computed from the OLD summaries be cached under
+        # the NEW version. Same ordering as _rebuild_communities in graph.py.
+        invalidate_retrieval_cache()
 
         await job_bus.publish(
             job_id,
@@ -103,6 +117,11 @@ async def _process_document(job_id: str, chunks: list[str], filename: str, theme
         )
     except Exception as e:  # noqa: BLE001
         logger.exception("❌ Background processing failed for %s", filename)
+        # A failure here may land after build_knowledge_graph already wrote
+        # nodes and edges — and that partial graph is deliberately kept (see
+        # _cluster_communities) — so the cache must stop serving pre-ingest
+        # answers on this path too.
+        invalidate_retrieval_cache()
         await job_bus.publish(job_id, {"type": "error", "data": str(e)})
 
 
@@ -122,14 +141,21 @@ async def upload_document(
     if not file.filename or not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported.")
 
-    contents = await file.read()
-    logger.info("📄 Read %s bytes from %s", len(contents), file.filename)
-
-    try:
-        chunks = extract_text_from_pdf(contents)
-    except Exception as e:
-        logger.exception("❌ PDF parsing failed")
-        raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {e}") from e
+    with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY) as spool:
+        size = 0
+        while chunk := await file.read(UPLOAD_READ_CHUNK):
+            size += len(chunk)
+            spool.write(chunk)
+        spool.seek(0)
+        logger.info("📄 Read %s bytes from %s", size, file.filename)
+
+        try:
+            # pypdf is pure CPU; parsing a large document inline would stall
+            # the event loop for every other request the worker is serving.
+            chunks = await asyncio.to_thread(extract_text_from_pdf, spool)
+        except Exception as e:
+            logger.exception("❌ PDF parsing failed")
+            raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {e}") from e
 
     if not chunks:
         raise HTTPException(
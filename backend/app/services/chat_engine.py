@@ -43,7 +43,8 @@ from __future__ import annotations
 
 import logging
 import re
-from collections import deque
+import time
+from collections import OrderedDict, deque
 from collections.abc import AsyncGenerator
 from itertools import zip_longest
 
@@ -225,11 +226,12 @@ async def _seeds_by_keyword(question: str, k: int) -> list[dict]:
     q = _keyword_query(question)
     if not q:
         return []
+    # The limit rides inside the procedure call so Lucene stops after the top-k
+    # hits, instead of streaming every match out and discarding them post-LIMIT.
     query = """
-    CALL db.index.fulltext.queryNodes($index, $q) YIELD node, score
+    CALL db.index.fulltext.queryNodes($index, $q, {limit: $k}) YIELD node, score
     RETURN node.name AS name, node.type AS type,
            node.description AS description, score
-    LIMIT $k
     """
     try:
         return await execute_query(
@@ -747,6 +749,45 @@ async def _global_search(question: str, k: int, settings=None) -> Retrieval | No
     return Retrieval(context, citations, [], "global", sources)
 
 
+# ── Retrieval cache ──────────────────────────────────────────────────────────
+# Chat has huge question locality (retries, rephrasings, follow-ups over the
+# same subgraph), so completed Retrieval objects are kept in a small TTL'd LRU
+# keyed by the normalized question. A hit skips every Neo4j round-trip and the
+# context formatting. The graph version rides inside the key: ingesting or
+# clearing the graph bumps it, instantly orphaning all cached answers.
+_retrieval_cache: OrderedDict[tuple, tuple[float, Retrieval]] = OrderedDict()
+_graph_version = 0
+
+
+def invalidate_retrieval_cache() -> None:
+    """Drop all cached retrievals — call whenever the graph's content changes."""
+    global _graph_version
+    _graph_version += 1
+    _retrieval_cache.clear()
+
+
+def _cached_retrieval(key: tuple) -> Retrieval | None:
+    entry = _retrieval_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        _retrieval_cache.pop(key, None)
+        return None
+    _retrieval_cache.move_to_end(key)
+    return result
+
+
+def _store_retrieval(key: tuple, result: Retrieval, settings) -> None:
+    _retrieval_cache[key] = (
+        time.monotonic() + settings.retrieval_cache_ttl_seconds,
+        result,
+    )
+    _retrieval_cache.move_to_end(key)
+    while len(_retrieval_cache) > settings.retrieval_cache_max_entries:
+        _retrieval_cache.popitem(last=False)
+
+
 # ── Retrieval entry point ────────────────────────────────────────────────────
 async def _local_search(question: str, k: int, settings) -> Retrieval:
     """Hybrid seeding + multi-hop expansion + reasoning-path extraction."""
@@ -778,14 +819,32 @@ async def retrieve_subgraph(question: str, k: int = 8) -> Retrieval:
     order, used to highlight nodes in the UI. The returned object additionally
     exposes ``.paths`` (reasoning chains), ``.sources`` (the source excerpts
     injected into the context) and ``.mode`` ("local" | "global").
+
+    Results are served from :data:`_retrieval_cache` when the same (normalized)
+    question was answered within the TTL and the graph has not changed since.
     """
     settings = get_settings()
+    cache_enabled = (
+        settings.retrieval_cache_max_entries > 0
+        and settings.retrieval_cache_ttl_seconds > 0
+    )
+    key = (question.strip().casefold(), k, _graph_version)
+    if cache_enabled:
+        cached = _cached_retrieval(key)
+        if cached is not None:
+            return cached
+
     if classify_query(question) == "global":
         result = await _global_search(question, k, settings)
         if result is not None:
+            if cache_enabled:
+                _store_retrieval(key, result, settings)
             return result
         logger.info("No communities available; answering '%s' locally", question[:60])
-    return await _local_search(question, k, settings)
+    result = await _local_search(question, k, settings)
+    if cache_enabled:
+        _store_retrieval(key, result, settings)
+    return result
 
 
 # ── Generation ───────────────────────────────────────────────────────────────
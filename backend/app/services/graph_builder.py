@@ -28,11 +28,12 @@ each get domain-appropriate entity/relationship types.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
+import unicodedata
 from collections.abc import Awaitable, Callable
 
+import orjson
 from langchain_core.prompts import ChatPromptTemplate
 
 from app.config import Settings, get_settings
@@ -70,7 +71,7 @@ DEFAULT_THEME = "Generic"
 
 
 # ── Dynamic Prompt Builder ───────────────────────────
-def get_extraction_prompt(theme: str) -> ChatPromptTemplate:
+def _build_extraction_prompt(theme: str) -> ChatPromptTemplate:
     schema = THEMES.get(theme, THEMES[DEFAULT_THEME])
     entity_types = ", ".join(schema["entities"])
     rel_types = ", ".join(schema["relationships"])
@@ -113,6 +114,25 @@ CRITICAL RULES:
     )
 
 
+# The themes are a closed set, so every prompt is built once at import — a
+# malformed template now fails the app at startup instead of failing the first
+# upload that happens to pick that theme.
+EXTRACTION_PROMPTS: dict[str, ChatPromptTemplate] = {
+    theme: _build_extraction_prompt(theme) for theme in THEMES
+}
+
+
+def get_extraction_prompt(theme: str) -> ChatPromptTemplate:
+    """Return the prebuilt prompt for ``theme``, falling back to Generic."""
+    return EXTRACTION_PROMPTS.get(theme, EXTRACTION_PROMPTS[DEFAULT_THEME])
+
+
+# Compiled once: _parse_llm_json runs per extracted chunk, and relying on the
+# stdlib's size-capped, process-shared pattern cache is a silent gamble.
+_JSON_FENCE = re.compile(r"```(?:json)?")
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+
 def _parse_llm_json(text: str) -> dict:
     """Parse JSON from an LLM response, tolerating markdown fences and prose.
 
@@ -124,19 +144,21 @@ def _parse_llm_json(text: str) -> dict:
     if not text:
         return empty
 
-    cleaned = re.sub(r"```(?:json)?", "", text).strip().strip("`").strip()
+    cleaned = _JSON_FENCE.sub("", text).strip().strip("`").strip()
 
+    # orjson decodes these medium-size payloads several times faster than the
+    # stdlib — this runs once per extracted chunk, so it adds up per document.
     try:
-        parsed = json.loads(cleaned)
-    except json.JSONDecodeError:
+        parsed = orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
         # Fall back to the outermost brace-delimited object.
-        match = re.search(r"\{.*\}", cleaned, re.DOTALL)
+        match = _JSON_OBJECT.search(cleaned)
         if not match:
             logger.warning("Failed to parse LLM JSON: %s", text[:200])
             return empty
         try:
-            parsed = json.loads(match.group(0))
-        except json.JSONDecodeError:
+            parsed = orjson.loads(match.group(0))
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse LLM JSON (brace fallback): %s", text[:200])
             return empty
 
@@ -164,7 +186,12 @@ async def _extract_with_timeout(
             ),
             timeout=timeout,
         )
-        parsed = _parse_llm_json(getattr(response, "content", "") or "")
+        # Multi-KB responses arrive concurrently from every in-flight chunk;
+        # parsing them inline would stall the event loop (and the chat stream)
+        # for the regex + JSON decode of each one.
+        parsed = await asyncio.to_thread(
+            _parse_llm_json, getattr(response, "content", "") or ""
+        )
         logger.info(
             "   Chunk %s: %s entities, %s relationships",
             chunk_idx,
@@ -180,13 +207,43 @@ async def _extract_with_timeout(
         return {"entities": [], "relationships": []}
 
 
+def _canonical_key(name: str) -> str:
+    """Fold a name for duplicate detection: NFKC + trim + casefold.
+
+    NFKC collapses Unicode presentation variants (fullwidth forms, ligatures,
+    composed vs. decomposed accents) that PDF extraction routinely produces, so
+    "Résumé" survives as one entity however the source file encoded it.
+    """
+    return unicodedata.normalize("NFKC", name).strip().casefold()
+
+
 def _dedupe_entities(entities: list[dict]) -> list[dict]:
-    """Collapse entities to one per canonical (lowercased, trimmed) name."""
+    """Collapse entities to one per canonical (folded, trimmed) name."""
     seen: dict[str, dict] = {}
     for entity in entities:
         name = str(entity.get("name", "")).strip()
         if name:
-            seen[name.lower()] = entity
+            seen[_canonical_key(name)] = entity
+    return list(seen.values())
+
+
+def _dedupe_relationships(relationships: list[dict]) -> list[dict]:
+    """Collapse relationships to one per (source, target, type) triple.
+
+    Overlapping chunks extract the same edge several times; each copy would be
+    an idempotent-but-paid MERGE row. Endpoints are folded with
+    :func:`_canonical_key` and the type is normalized the same way the write
+    path normalizes it, so every row that would MERGE onto the same
+    relationship collapses here instead.
+    """
+    seen: dict[tuple[str, str, str], dict] = {}
+    for rel in relationships:
+        source = str(rel.get("source", "")).strip()
+        target = str(rel.get("target", "")).strip()
+        if not source or not target:
+            continue
+        rel_type = str(rel.get("type", "RELATED_TO")).replace(" ", "_").upper()
+        seen[(_canonical_key(source), _canonical_key(target), rel_type)] = rel
     return list(seen.values())
 
 
@@ -274,7 +331,7 @@ def _collapse_duplicate_entities(
 
 def _canonicalize_chunk_names(
     names_per_chunk: list[list[str]],
-    survivor_by_lower: dict[str, str],
+    survivor_by_key: dict[str, str],
     alias_map: dict[str, str],
     kept_names: set[str],
 ) -> list[list[str]]:
@@ -295,7 +352,7 @@ def _canonicalize_chunk_names(
     for names in names_per_chunk:
         resolved: list[str] = []
         for raw in names:
-            name = survivor_by_lower.get(raw.lower(), raw)
+            name = survivor_by_key.get(_canonical_key(raw), raw)
             name = alias_map.get(name, name)
             if name in kept_names and name not in resolved:
                 resolved.append(name)
@@ -327,6 +384,7 @@ async def _resolve_against_graph(
     fresh_entities: list[dict],
     embeddings_by_name: dict[str, list[float]],
     settings: Settings,
+    snapshot: tuple[list[dict], dict[str, list[float]]] | None = None,
 ) -> int:
     """Merge the just-written entities into equivalents from earlier documents.
 
@@ -335,8 +393,18 @@ async def _resolve_against_graph(
     and "PostgreSQL" from document 2 still end up as one node. Only clusters that
     involve at least one fresh entity are merged — the rest of the graph is left
     exactly as previous ingests decided.
+
+    ``snapshot`` is an already-fetched ``(entities, embeddings_by_name)`` pair
+    from :func:`entity_resolution.fetch_graph_entities`. It only needs to
+    describe *earlier* ingests — the fresh entities are overlaid from memory
+    below — which is what lets ``build_knowledge_graph`` start the fetch while
+    the LLM calls are still in flight.
     """
-    graph_entities, graph_embeddings = await entity_resolution.fetch_graph_entities()
+    graph_entities, graph_embeddings = (
+        snapshot
+        if snapshot is not None
+        else await entity_resolution.fetch_graph_entities()
+    )
     if not graph_entities:
         return 0
 
@@ -393,13 +461,22 @@ async def build_knowledge_graph(
     chain = get_extraction_prompt(theme) | llm
 
     total = len(chunks)
-    semaphore = asyncio.Semaphore(settings.extraction_concurrency)
     completed = 0
     completed_lock = asyncio.Lock()
 
-    async def process_chunk(idx: int, c: str) -> dict:
-        nonlocal completed
-        async with semaphore:
+    # Overlap DB I/O with LLM latency: the whole-graph snapshot that feeds the
+    # cross-document resolution pass at the end doesn't depend on anything this
+    # ingest writes (fresh entities are overlaid from memory), so it can load
+    # while the extraction calls are in flight instead of extending the tail.
+    graph_snapshot = (
+        asyncio.create_task(entity_resolution.fetch_graph_entities())
+        if settings.entity_resolution_enabled
+        else None
+    )
+
+    try:
+        async def process_chunk(idx: int, c: str) -> dict:
+            nonlocal completed
             logger.info("🔍 Processing chunk %s/%s (%s chars)...", idx, total, len(c))
             parsed = await _extract_with_timeout(
                 chain,
@@ -409,134 +486,169 @@ async def build_knowledge_graph(
                 theme=theme,
                 document_name=document_name,
             )
-        async with completed_lock:
-            completed += 1
-            await report(
-                {
-                    "type": "progress",
-                    "stage": "extracting",
-                    "processed": completed,
-                    "total": total,
-                    "entities_so_far": len(parsed["entities"]),
-                }
+            async with completed_lock:
+                completed += 1
+                await report(
+                    {
+                        "type": "progress",
+                        "stage": "extracting",
+                        "processed": completed,
+                        "total": total,
+                        "entities_so_far": len(parsed["entities"]),
+                    }
+                )
+            return parsed
+
+        # A fixed pool of workers drains a queue instead of one coroutine per
+        # chunk: however high max_chunks is configured, the number of live
+        # coroutines stays at extraction_concurrency, and each result is written
+        # into its chunk's slot so the positional mapping below survives.
+        pending: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        for i, chunk in enumerate(chunks):
+            pending.put_nowait((i, chunk))
+        results: list[dict] = [{"entities": [], "relationships": []} for _ in chunks]
+
+        async def worker() -> None:
+            while True:
+                try:
+                    i, chunk = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[i] = await process_chunk(i + 1, chunk)
+
+        if total:
+            workers = min(max(1, settings.extraction_concurrency), total)
+            await asyncio.gather(*(worker() for _ in range(workers)))
+
+        all_entities: list[dict] = []
+        all_relationships: list[dict] = []
+        # ``results[i]`` is chunk i — which is what lets us remember *which chunk
+        # each entity came from* and later wire (:Entity)-[:MENTIONED_IN]->(:Chunk).
+        names_per_chunk: list[list[str]] = []
+        for parsed in results:
+            all_entities.extend(parsed["entities"])
+            all_relationships.extend(parsed["relationships"])
+            names_per_chunk.append(
+                [
+                    str(e.get("name", "")).strip()
+                    for e in parsed["entities"]
+                    if str(e.get("name", "")).strip()
+                ]
             )
-        return parsed
-
-    results = await asyncio.gather(
-        *(process_chunk(i + 1, chunk) for i, chunk in enumerate(chunks))
-    )
 
-    all_entities: list[dict] = []
-    all_relationships: list[dict] = []
-    # ``asyncio.gather`` preserves argument order, so ``results[i]`` is chunk i —
-    # which is what lets us remember *which chunk each entity came from* and
-    # later wire (:Entity)-[:MENTIONED_IN]->(:Chunk).
-    names_per_chunk: list[list[str]] = []
-    for parsed in results:
-        all_entities.extend(parsed["entities"])
-        all_relationships.extend(parsed["relationships"])
-        names_per_chunk.append(
-            [
-                str(e.get("name", "")).strip()
-                for e in parsed["entities"]
-                if str(e.get("name", "")).strip()
-            ]
+        logger.info(
+            "📊 Extraction complete: %s entities, %s rels",
+            len(all_entities),
+            len(all_relationships),
         )
 
-    logger.info(
-        "📊 Extraction complete: %s entities, %s rels",
-        len(all_entities),
-        len(all_relationships),
-    )
-
-    unique_entities = _dedupe_entities(all_entities)
-    logger.info("🧹 Deduplicated to %s unique entities", len(unique_entities))
-
-    # Snapshot the case-folding collapse *before* resolution rebinds the list, so
-    # a chunk that said "python" can still find the "Python" node that survived.
-    survivor_by_lower = {
-        str(e.get("name", "")).strip().lower(): str(e.get("name", "")).strip()
-        for e in unique_entities
-    }
+        unique_entities = _dedupe_entities(all_entities)
+        logger.info("🧹 Deduplicated to %s unique entities", len(unique_entities))
 
-    await report({"type": "progress", "stage": "embedding", "total": len(unique_entities)})
-    embeddings_by_name = await _embed_entities(unique_entities)
+        # Snapshot the case-folding collapse *before* resolution rebinds the list, so
+        # a chunk that said "python" can still find the "Python" node that survived.
+        survivor_by_key = {
+            _canonical_key(str(e.get("name", ""))): str(e.get("name", "")).strip()
+            for e in unique_entities
+        }
 
-    entities_merged = 0
-    alias_map: dict[str, str] = {}
-    if settings.entity_resolution_enabled:
-        await report(
-            {
-                "type": "progress",
-                "stage": "resolving_entities",
-                "processed": 0,
-                "total": len(unique_entities),
-                "merged": 0,
-            }
-        )
-        # CPU-bound and synchronous by design — see _collapse_duplicate_entities.
-        unique_entities, all_relationships, entities_merged, alias_map = await asyncio.to_thread(
-            _collapse_duplicate_entities,
-            unique_entities,
-            all_relationships,
-            embeddings_by_name,
-            settings,
-        )
-        logger.info("🧬 Resolved %s duplicate entities within this document", entities_merged)
-
-    await report({"type": "progress", "stage": "writing_nodes", "total": len(unique_entities)})
-    nodes_created = await _write_entities(unique_entities, document_name, embeddings_by_name)
-    logger.info("✅ Wrote %s nodes to Neo4j", nodes_created)
-
-    await report({"type": "progress", "stage": "writing_edges", "total": len(all_relationships)})
-    rels_created = await _write_relationships(all_relationships)
-    logger.info("✅ Wrote %s relationships to Neo4j", rels_created)
-
-    # Chunks are stored here — after the entity nodes exist (so MENTIONED_IN has
-    # something to attach to) but *before* the whole-graph resolution pass below.
-    # That pass merges nodes in the database and re-points every relationship a
-    # duplicate held, MENTIONED_IN included; storing first therefore lets the
-    # merge carry the chunk links along. Storing afterwards would look up names
-    # the merge had already deleted and silently drop those excerpts.
-    chunks_stored = 0
-    if settings.store_source_chunks:
-        chunks_stored = await _store_source_chunks(
-            chunks,
-            _canonicalize_chunk_names(
-                names_per_chunk,
-                survivor_by_lower,
-                alias_map,
-                {str(e.get("name", "")).strip() for e in unique_entities},
-            ),
-            document_name,
-            report,
-        )
+        await report({"type": "progress", "stage": "embedding", "total": len(unique_entities)})
+        embeddings_by_name = await _embed_entities(unique_entities)
 
-    if settings.entity_resolution_enabled:
-        # Edges are written first so their endpoints still exist; this pass then
-        # re-points them onto entities from earlier documents.
-        entities_merged += await _resolve_against_graph(
-            unique_entities, embeddings_by_name, settings
-        )
-        await report(
-            {
-                "type": "progress",
-                "stage": "resolving_entities",
-                "processed": len(unique_entities),
-                "total": len(unique_entities),
-                "merged": entities_merged,
-            }
-        )
-        logger.info("🧬 Entity resolution merged %s duplicates in total", entities_merged)
+        entities_merged = 0
+        alias_map: dict[str, str] = {}
+        if settings.entity_resolution_enabled:
+            await report(
+                {
+                    "type": "progress",
+                    "stage": "resolving_entities",
+                    "processed": 0,
+                    "total": len(unique_entities),
+                    "merged": 0,
+                }
+            )
+            # CPU-bound and synchronous by design — see _collapse_duplicate_entities.
+            unique_entities, all_relationships, entities_merged, alias_map = await asyncio.to_thread(
+                _collapse_duplicate_entities,
+                unique_entities,
+                all_relationships,
+                embeddings_by_name,
+                settings,
+            )
+            logger.info("🧬 Resolved %s duplicate entities within this document", entities_merged)
+
+        await report({"type": "progress", "stage": "writing_nodes", "total": len(unique_entities)})
+        nodes_created = await _write_entities(unique_entities, document_name, embeddings_by_name)
+        logger.info("✅ Wrote %s nodes to Neo4j", nodes_created)
+
+        # Resolution may have rewritten several extracted edges onto the same
+        # canonical endpoints — drop the copies before they become MERGE rows.
+        all_relationships = _dedupe_relationships(all_relationships)
+
+        await report({"type": "progress", "stage": "writing_edges", "total": len(all_relationships)})
+        rels_created = await _write_relationships(all_relationships)
+        logger.info("✅ Wrote %s relationships to Neo4j", rels_created)
+
+        # Chunks are stored here — after the entity nodes exist (so MENTIONED_IN has
+        # something to attach to) but *before* the whole-graph resolution pass below.
+        # That pass merges nodes in the database and re-points every relationship a
+        # duplicate held, MENTIONED_IN included; storing first therefore lets the
+        # merge carry the chunk links along. Storing afterwards would look up names
+        # the merge had already deleted and silently drop those excerpts.
+        chunks_stored = 0
+        if settings.store_source_chunks:
+            chunks_stored = await _store_source_chunks(
+                chunks,
+                _canonicalize_chunk_names(
+                    names_per_chunk,
+                    survivor_by_key,
+                    alias_map,
+                    {str(e.get("name", "")).strip() for e in unique_entities},
+                ),
+                document_name,
+                report,
+            )
 
-    return {
-        "nodes_created": nodes_created,
-        "relationships_created": rels_created,
-        "entities_extracted": len(all_entities),
-        "unique_entities": len(unique_entities),
-        "entities_merged": entities_merged,
-        "chunks_stored": chunks_stored,
-    }
+        if settings.entity_resolution_enabled:
+            # Edges are written first so their endpoints still exist; this pass then
+            # re-points them onto entities from earlier documents.
+            entities_merged += await _resolve_against_graph(
+                unique_entities,
+                embeddings_by_name,
+                settings,
+                snapshot=await graph_snapshot if graph_snapshot is not None else None,
+            )
+            await report(
+                {
+                    "type": "progress",
+                    "stage": "resolving_entities",
+                    "processed": len(unique_entities),
+                    "total": len(unique_entities),
+                    "merged": entities_merged,
+                }
+            )
+            logger.info("🧬 Entity resolution merged %s duplicates in total", entities_merged)
+
+        return {
+            "nodes_created": nodes_created,
+            "relationships_created": rels_created,
+            "entities_extracted": len(all_entities),
+            "unique_entities": len(unique_entities),
+            "entities_merged": entities_merged,
+            "chunks_stored": chunks_stored,
+        }
+    finally:
+        # An exception anywhere above would otherwise abandon the prefetch: an
+        # unretrieved-exception warning at best, plus a whole-graph read still
+        # running behind an ingest that already failed. Cancel and consume the
+        # task on every exit; on the success path it is already done and this
+        # is a no-op.
+        if graph_snapshot is not None:
+            graph_snapshot.cancel()
+            try:
+                await graph_snapshot
+            except (asyncio.CancelledError, Exception):  # noqa: BLE001
+                pass
 
 
 async def _write_entities(
@@ -544,96 +656,137 @@ async def _write_entities(
     document_name: str,
     embeddings_by_name: dict[str, list[float]],
 ) -> int:
-    """MERGE each entity node, storing type, description, source doc, embedding.
+    """MERGE every entity node in one batched UNWIND round-trip.
 
-    ``aliases`` (the names entity resolution folded into this one) are appended
-    rather than replaced, so a node keeps every alias it has ever absorbed.
+    One Cypher call covers the whole document — the per-entity loop this
+    replaces paid a full Bolt round-trip per node, which dominated the write
+    phase on real documents. ``aliases`` (the names entity resolution folded
+    into this one) are appended rather than replaced, so a node keeps every
+    alias it has ever absorbed.
     """
+    if not entities:
+        return 0
+
+    rows = []
+    for entity in entities:
+        # MUST match the normalization used everywhere else (_dedupe_entities and
+        # _canonicalize_chunk_names both strip). Writing " Ada " here while the
+        # chunk linker looks up "Ada" creates a node no MENTIONED_IN edge can
+        # ever match, silently losing that entity's source excerpts.
+        name = str(entity.get("name", "Unknown")).strip() or "Unknown"
+        rows.append(
+            {
+                "name": name,
+                "type": entity.get("type", "UNKNOWN"),
+                "description": entity.get("description", ""),
+                "embedding": embeddings_by_name.get(name),
+                "aliases": sorted(entity.get("aliases") or []),
+            }
+        )
+
     query = """
-    MERGE (n:Entity {name: $name})
-    SET n.type = $type,
-        n.description = $description,
+    UNWIND $rows AS row
+    MERGE (n:Entity {name: row.name})
+    SET n.type = row.type,
+        n.description = row.description,
         n.document = $document,
-        n.aliases = [a IN coalesce(n.aliases, []) WHERE NOT a IN $aliases] + $aliases
-    WITH n
+        n.aliases = [a IN coalesce(n.aliases, []) WHERE NOT a IN row.aliases] + row.aliases
+    WITH n, row
     CALL {
-        WITH n
-        WITH n WHERE $embedding IS NOT NULL
-        CALL db.create.setNodeVectorProperty(n, 'embedding', $embedding)
+        WITH n, row
+        WITH n, row WHERE row.embedding IS NOT NULL
+        CALL db.create.setNodeVectorProperty(n, 'embedding', row.embedding)
     }
-    RETURN n.name AS name
+    RETURN count(n) AS written
     """
     fallback_query = """
-    MERGE (n:Entity {name: $name})
-    SET n.type = $type,
-        n.description = $description,
+    UNWIND $rows AS row
+    MERGE (n:Entity {name: row.name})
+    SET n.type = row.type,
+        n.description = row.description,
         n.document = $document,
-        n.aliases = [a IN coalesce(n.aliases, []) WHERE NOT a IN $aliases] + $aliases
+        n.aliases = [a IN coalesce(n.aliases, []) WHERE NOT a IN row.aliases] + row.aliases
+    RETURN count(n) AS written
     """
-    created = 0
-    for entity in entities:
-        # MUST match the normalization used everywhere else (_dedupe_entities and
-        # _canonicalize_chunk_names both strip). Writing " Ada " here while the
-        # chunk linker looks up "Ada" creates a node no MENTIONED_IN edge can
-        # ever match, silently losing that entity's source excerpts.
-        name = str(entity.get("name", "Unknown")).strip() or "Unknown"
-        params = {
-            "name": name,
-            "type": entity.get("type", "UNKNOWN"),
-            "description": entity.get("description", ""),
-            "document": document_name,
-            "embedding": embeddings_by_name.get(name),
-            "aliases": sorted(entity.get("aliases") or []),
-        }
+    params = {"rows": rows, "document": document_name}
+    try:
+        result = await execute_query(query, params)
+    except Exception:  # noqa: BLE001 - older Neo4j lacks vector procs
         try:
-            await execute_query(query, params)
-            created += 1
-        except Exception:  # noqa: BLE001 - older Neo4j lacks vector procs
-            try:
-                await execute_query(fallback_query, params)
-                created += 1
-            except Exception as e:  # noqa: BLE001
-                logger.warning("⚠️ Node write failed for %s: %s", name, e)
-    return created
+            result = await execute_query(fallback_query, params)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("⚠️ Batched node write failed (%s rows): %s", len(rows), e)
+            return 0
+    return int(result[0].get("written", len(rows))) if result else len(rows)
+
+
+#: Anything the LLM emits that cannot be a Cypher relationship type after
+#: normalization is written as :RELATED_TO with the raw type kept as a property.
+_REL_TYPE_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
 
 
 async def _write_relationships(relationships: list[dict]) -> int:
-    """Write typed relationships, falling back to :RELATED_TO if APOC is absent."""
-    created = 0
+    """Write typed relationships, falling back to :RELATED_TO if APOC is absent.
+
+    Both paths are batched: the APOC path sends every relationship in a single
+    UNWIND (the type is a plain value to ``apoc.merge.relationship``), and the
+    fallback groups by relationship type — the type must be interpolated into
+    the MERGE pattern, so each distinct type costs one round-trip instead of
+    one per relationship.
+    """
+    rows = []
     for rel in relationships:
         source = str(rel.get("source", "")).strip()
         target = str(rel.get("target", "")).strip()
-        rel_type = str(rel.get("type", "RELATED_TO")).replace(" ", "_").upper()
-        description = rel.get("description", "")
         if not source or not target:
             continue
+        rows.append(
+            {
+                "source": source,
+                "target": target,
+                "rel_type": str(rel.get("type", "RELATED_TO")).replace(" ", "_").upper(),
+                "description": rel.get("description", ""),
+            }
+        )
+    if not rows:
+        return 0
 
-        apoc_query = """
-        MATCH (a:Entity {name: $source})
-        MATCH (b:Entity {name: $target})
-        CALL apoc.merge.relationship(a, $rel_type, {description: $description}, {}, b, {})
-        YIELD rel
-        RETURN rel
+    apoc_query = """
+    UNWIND $rows AS row
+    MATCH (a:Entity {name: row.source})
+    MATCH (b:Entity {name: row.target})
+    CALL apoc.merge.relationship(a, row.rel_type, {description: row.description}, {}, b, {})
+    YIELD rel
+    RETURN count(rel) AS written
+    """
+    try:
+        result = await execute_query(apoc_query, {"rows": rows})
+        return int(result[0].get("written", len(rows))) if result else len(rows)
+    except Exception:  # noqa: BLE001 - APOC not installed
+        pass
+
+    # Cypher cannot parameterize a relationship type, so interpolate it — but
+    # only after validating against _REL_TYPE_PATTERN, never raw LLM output.
+    by_type: dict[str, list[dict]] = {}
+    for row in rows:
+        rel_type = row["rel_type"] if _REL_TYPE_PATTERN.match(row["rel_type"]) else "RELATED_TO"
+        by_type.setdefault(rel_type, []).append(row)
+
+    created = 0
+    for rel_type, group in by_type.items():
+        fallback_query = f"""
+        UNWIND $rows AS row
+        MATCH (a:Entity {{name: row.source}})
+        MATCH (b:Entity {{name: row.target}})
+        MERGE (a)-[r:{rel_type}]->(b)
+        SET r.type = row.rel_type, r.description = row.description
+        RETURN count(r) AS written
         """
         try:
-            await execute_query(
-                apoc_query,
-                {"source": source, "target": target, "rel_type": rel_type, "description": description},
+            result = await execute_query(fallback_query, {"rows": group})
+            created += int(result[0].get("written", len(group))) if result else len(group)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "⚠️ Batched relationship write failed (:%s, %s rows): %s", rel_type, len(group), e
             )
-            created += 1
-        except Exception:  # noqa: BLE001 - APOC not installed / node missing
-            fallback_query = """
-            MATCH (a:Entity {name: $source})
-            MATCH (b:Entity {name: $target})
-            MERGE (a)-[r:RELATED_TO]->(b)
-            SET r.type = $rel_type, r.description = $description
-            """
-            try:
-                await execute_query(
-                    fallback_query,
-                    {"source": source, "target": target, "rel_type": rel_type, "description": description},
-                )
-                created += 1
-            except Exception as e:  # noqa: BLE001
-                logger.warning("⚠️ Relationship write failed (%s -> %s): %s", source, target, e)
     return created
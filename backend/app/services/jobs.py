@@ -19,12 +19,17 @@ swap is mechanical.
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 
 # A terminal event type ends the SSE stream.
 TERMINAL_TYPES = {"done", "error"}
 
+# Jobs whose SSE stream is never opened are only reaped by eviction, so cap
+# how many the bus retains. 1000 jobs is far beyond any realistic backlog.
+MAX_JOBS = 1000
+
 
 @dataclass
 class Job:
@@ -37,16 +42,36 @@ class Job:
 class JobBus:
     """Registry of in-flight jobs and their event queues (one consumer each)."""
 
-    def __init__(self) -> None:
-        self._jobs: dict[str, Job] = {}
+    def __init__(self, max_jobs: int = MAX_JOBS) -> None:
+        # Insertion-ordered so eviction can walk oldest-first.
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._max_jobs = max_jobs
         self._counter = 0
 
     def create(self) -> str:
+        self._evict()
         self._counter += 1
         job_id = f"job_{self._counter:06d}"
         self._jobs[job_id] = Job(id=job_id)
         return job_id
 
+    def _evict(self) -> None:
+        """Keep the registry bounded: without this, jobs whose stream was
+        never consumed would accumulate for the life of the process."""
+        if len(self._jobs) < self._max_jobs:
+            return
+        # Prefer dropping finished jobs (their events were already retained
+        # past completion as a courtesy), oldest first.
+        for job_id, job in list(self._jobs.items()):
+            if job.finished:
+                del self._jobs[job_id]
+                if len(self._jobs) < self._max_jobs:
+                    return
+        # Still over: drop the oldest outright — if its uploader is ever
+        # coming back, it would have happened by a thousand jobs later.
+        while len(self._jobs) >= self._max_jobs:
+            self._jobs.popitem(last=False)
+
     async def publish(self, job_id: str, event: dict) -> None:
         job = self._jobs.get(job_id)
         if job is None:
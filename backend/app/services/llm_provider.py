@@ -101,6 +101,15 @@ def _missing_package(
 
 
 # ── Chat models ──────────────────────────────────────────
+#: Constructed chat clients keyed on (resolved config, call options). Building
+#: one per request re-creates the underlying HTTP client and loses keep-alive
+#: connections to the backend; the handful of (streaming, json_mode,
+#: temperature) combinations Synapse uses are built once and reused. Keyed on
+#: the serialized Settings (like _load_embeddings, which caches on the resolved
+#: primitives) so a different .env / test configuration gets its own client.
+_chat_llm_cache: dict[tuple[str, bool, bool, float | None], BaseChatModel | Runnable] = {}
+
+
 def get_chat_llm(
     *,
     streaming: bool = False,
@@ -108,7 +117,7 @@ def get_chat_llm(
     temperature: float | None = None,
     settings: Settings | None = None,
 ) -> BaseChatModel | Runnable:
-    """Return a LangChain chat model for the configured provider.
+    """Return the (cached) LangChain chat model for the configured provider.
 
     Returns a ``Runnable`` rather than a bare chat model when a provider needs
     invoke-time options bound (Gemini's JSON mode) — both compose identically
@@ -121,6 +130,29 @@ def get_chat_llm(
         temperature: sampling temperature; defaults per-provider if None.
     """
     settings = settings or get_settings()
+    serialize = getattr(settings, "model_dump_json", None)
+    if serialize is None:  # a Settings stand-in: build uncached
+        return _build_chat_llm(
+            streaming=streaming, json_mode=json_mode, temperature=temperature, settings=settings
+        )
+    key = (serialize(), streaming, json_mode, temperature)
+    llm = _chat_llm_cache.get(key)
+    if llm is None:
+        llm = _build_chat_llm(
+            streaming=streaming, json_mode=json_mode, temperature=temperature, settings=settings
+        )
+        _chat_llm_cache[key] = llm
+    return llm
+
+
+def _build_chat_llm(
+    *,
+    streaming: bool,
+    json_mode: bool,
+    temperature: float | None,
+    settings: Settings,
+) -> BaseChatModel | Runnable:
+    """Construct a chat model — only on a :data:`_chat_llm_cache` miss."""
     provider = settings.llm_provider.lower()
     temp = temperature if temperature is not None else 0.2
 
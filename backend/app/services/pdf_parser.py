@@ -6,15 +6,56 @@ Synapse — PDF Parser Service
 
 Extracts text from a PDF and splits it into overlapping, sentence-aware chunks
 so each chunk carries enough context for good entity extraction.
+
+Chunking streams: pages are read one at a time into a rolling buffer and chunks
+are yielded as soon as the buffer can fill one, so peak memory is bounded by
+the chunk size plus one page — never the whole document's text — and the first
+chunk is available before the last page has been parsed.
 """
 
 from __future__ import annotations
 
 import io
+import logging
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
 
 from pypdf import PdfReader
 
-_BOUNDARIES = (". ", "? ", "! ", "\n")
+# PDFium (C, via pypdfium2) extracts text several times faster than pure-Python
+# pypdf on the same documents. It is optional: text extraction falls back to
+# pypdf whenever the binding is missing or a document trips it up.
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover - exercised only without the package
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+# PDFium is inherently not thread-safe and pypdfium2 adds no locking of its
+# own, while uploads parse on worker threads (asyncio.to_thread) — so two
+# concurrent uploads would otherwise drive PDFium from two threads at once.
+# One process-wide lock serializes every PDFium call, open through close;
+# serialized PDFium still beats parallel pypdf by a wide margin.
+_PDFIUM_LOCK = threading.Lock()
+
+# A sentence terminator followed by whitespace, or a line break. One compiled
+# pattern means one scan over the window, where the old per-boundary rfind
+# calls each re-walked it.
+_SENT_BOUNDARY = re.compile(r"[.?!]\s|\n")
+
+
+def _boundary_end(text: str, start: int, end: int) -> int:
+    """Best split point in ``text[start:end]``, preferring sentence boundaries.
+
+    Returns ``end`` unchanged when the window contains no boundary.
+    """
+    last = None
+    for match in _SENT_BOUNDARY.finditer(text, start, end):
+        last = match  # keep the rightmost match
+    return last.end() if last is not None else end
 
 
 def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> list[str]:
@@ -36,13 +77,7 @@ def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> list[st
 
         # Prefer to end on a sentence boundary within the window.
         if end < n:
-            best = -1
-            for boundary in _BOUNDARIES:
-                idx = text.rfind(boundary, start, end)
-                if idx != -1:
-                    best = max(best, idx + len(boundary))
-            if best != -1:
-                end = best
+            end = _boundary_end(text, start, end)
 
         chunk = text[start:end].strip()
         if chunk:
@@ -57,17 +92,94 @@ def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> list[st
     return chunks
 
 
-def extract_text_from_pdf(
-    pdf_bytes: bytes, chunk_size: int = 1000, overlap: int = 200
-) -> list[str]:
-    """Extract all page text from a PDF and return sentence-aware chunks."""
-    reader = PdfReader(io.BytesIO(pdf_bytes))
+def _chunks_from_pages(
+    pages: Iterable[str], chunk_size: int = 1000, overlap: int = 200
+) -> Iterator[str]:
+    """Chunk an incremental stream of page texts with a rolling buffer.
+
+    Yields exactly what :func:`chunk_text` would produce over the pages joined
+    with ``"\\n"``, but holds at most one chunk window plus one page of text at
+    a time: a chunk is emitted as soon as the buffer extends past the window
+    (so the boundary search sees the same text either way), keeping only the
+    ``overlap`` carry-over.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    overlap = max(0, min(overlap, chunk_size - 1))
 
-    parts: list[str] = []
+    buffer = ""
+    for page_text in pages:
+        if not page_text:
+            continue
+        buffer = f"{buffer}\n{page_text}" if buffer else page_text
+
+        while len(buffer) > chunk_size:
+            end = _boundary_end(buffer, 0, chunk_size)
+            chunk = buffer[:end].strip()
+            if chunk:
+                yield chunk
+            # Advance with overlap, always making forward progress.
+            buffer = buffer[max(end - overlap, 1):]
+
+    tail = buffer.strip()
+    if tail:
+        yield tail
+
+
+def _iter_page_texts_pdfium(document) -> Iterator[str]:
+    """Page texts via PDFium. PDFium emits ``\\r\\n`` breaks; normalize them so
+    chunk boundaries land identically whichever extractor produced the text."""
+    try:
+        for page in document:
+            textpage = page.get_textpage()
+            yield (textpage.get_text_range() or "").replace("\r\n", "\n")
+            textpage.close()
+            page.close()
+    finally:
+        document.close()
+
+
+def _iter_page_texts_pypdf(pdf: bytes | BinaryIO) -> Iterator[str]:
+    """Page texts via pypdf (pure Python, always available)."""
+    reader = PdfReader(io.BytesIO(pdf) if isinstance(pdf, bytes) else pdf)
     for page in reader.pages:
-        page_text = page.extract_text()
-        if page_text:
-            parts.append(page_text)
+        yield page.extract_text() or ""
+
+
+def _iter_page_texts(pdf: bytes | BinaryIO) -> Iterator[str]:
+    """Yield each page's extracted text, lazily, in document order.
 
-    full_text = "\n".join(parts)
-    return chunk_text(full_text, chunk_size=chunk_size, overlap=overlap)
+    Accepts raw bytes or any seekable binary stream (both extractors need to
+    seek), so callers that already hold the PDF on disk — the upload spool —
+    never have to copy it into one in-memory blob first.
+    """
+    if pdfium is not None:
+        # Held across the whole iteration: this generator runs in whichever
+        # thread consumes it, so the with-block acquires and releases there.
+        with _PDFIUM_LOCK:
+            try:
+                document = pdfium.PdfDocument(pdf)
+            except Exception as e:  # noqa: BLE001 - a doc PDFium rejects may still parse
+                logger.warning("PDFium could not open the document (%s); using pypdf", e)
+                if not isinstance(pdf, bytes):
+                    pdf.seek(0)
+            else:
+                yield from _iter_page_texts_pdfium(document)
+                return
+    yield from _iter_page_texts_pypdf(pdf)
+
+
+def iter_pdf_chunks(
+    pdf: bytes | BinaryIO, chunk_size: int = 1000, overlap: int = 200
+) -> Iterator[str]:
+    """Stream sentence-aware chunks out of a PDF, page by page."""
+    return _chunks_from_pages(
+        _iter_page_texts(pdf), chunk_size=chunk_size, overlap=overlap
+    )
+
+
+def extract_text_from_pdf(
+    pdf: bytes | BinaryIO, chunk_size: int = 1000, overlap: int = 200
+) -> list[str]:
+    """Extract all page text from a PDF and return sentence-aware chunks."""
+    return list(iter_pdf_chunks(pdf, chunk_size=chunk_size, overlap=overlap))
@@ -23,13 +23,17 @@ os.environ.setdefault("LLM_PROVIDER", "ollama")
 def _clear_settings_cache():
     """Ensure each test sees a fresh, uncached Settings object."""
     from app.config import get_settings
-    from app.services import llm_provider
+    from app.services import chat_engine, llm_provider
 
     get_settings.cache_clear()
     llm_provider._load_embeddings.cache_clear()
+    llm_provider._chat_llm_cache.clear()
+    chat_engine._retrieval_cache.clear()
     yield
     get_settings.cache_clear()
     llm_provider._load_embeddings.cache_clear()
+    llm_provider._chat_llm_cache.clear()
+    chat_engine._retrieval_cache.clear()
 
 
 QueryHandler = Callable[[str, dict], list]
@@ -153,6 +153,24 @@ class TestUpload:
         assert body["total_chunks"] == 2
         assert body["status"] == "processing"
 
+    def test_upload_is_spooled_to_a_stream_not_a_bytes_blob(
+        self, client, monkeypatch, stub_communities
+    ):
+        stub_communities()
+        _stub_ingest(monkeypatch)
+        seen = {}
+
+        def fake_extract(pdf):
+            # The parser gets a rewound, readable stream — never one big blob.
+            seen["tell"] = pdf.tell()
+            seen["data"] = pdf.read()
+            return ["chunk a"]
+
+        monkeypatch.setattr(upload_router, "extract_text_from_pdf", fake_extract)
+        assert _upload(client)["total_chunks"] == 1
+        assert seen["tell"] == 0
+        assert seen["data"] == b"%PDF-1.4 fake"
+
     def test_empty_pdf_text_is_rejected(self, client, monkeypatch):
         monkeypatch.setattr(upload_router, "extract_text_from_pdf", lambda b: [])
         r = client.post(
@@ -290,6 +308,35 @@ MIXED_RELS = [
 _NODE_MATCH = re.compile(r"MATCH \(\w+(?::(\w+))?\)")
 _REL_MATCH = re.compile(r"MATCH \(\w+(?::(\w+))?\)-\[\w+(?::(\w+))?\]->\(\w+(?::(\w+))?\)")
 
+# The keys the router's map projection `n {.name, ...}` returns.
+_PROJECTED_KEYS = ("name", "type", "description", "document", "aliases")
+
+
+def _project_node(node: dict) -> dict:
+    """Emulate the router's Cypher node projection over a raw stored node.
+
+    Map projections emit every listed key, as null when the property is absent —
+    the router strips those, so the fake must hand the nulls back faithfully.
+    """
+    props = node["properties"]
+    fallback = node["labels"][0] if node["labels"] else "Unknown"
+    return {
+        "id": str(node["id"]),
+        "label": props.get("name") or fallback,
+        "type": props.get("type") or fallback,
+        "properties": {k: props.get(k) for k in _PROJECTED_KEYS},
+    }
+
+
+def _project_rel(rel: dict) -> dict:
+    """Emulate the router's Cypher relationship projection."""
+    return {
+        "source": str(rel["source"]),
+        "target": str(rel["target"]),
+        "type": rel["properties"].get("type") or rel["type"],
+        "properties": rel["properties"],
+    }
+
 
 def _mixed_graph_handler(query: str, params: dict) -> list[dict]:
     """Emulate Neo4j label matching over that mixed database.
@@ -301,14 +348,18 @@ def _mixed_graph_handler(query: str, params: dict) -> list[dict]:
     """
     by_id = {n["id"]: n for n in MIXED_NODES}
 
-    if "elementId(n) AS id" in query:
+    if "elementId(n)) AS id" in query:
         (label,) = _NODE_MATCH.search(query).groups()
-        return [n for n in MIXED_NODES if label is None or label in n["labels"]]
+        return [
+            _project_node(n)
+            for n in MIXED_NODES
+            if label is None or label in n["labels"]
+        ]
 
-    if "elementId(a) AS source" in query:
+    if "elementId(a)) AS source" in query:
         a_label, rel_type, b_label = _REL_MATCH.search(query).groups()
         return [
-            r
+            _project_rel(r)
             for r in MIXED_RELS
             if (a_label is None or a_label in by_id[r["source"]]["labels"])
             and (b_label is None or b_label in by_id[r["target"]]["labels"])
@@ -321,17 +372,21 @@ def _mixed_graph_handler(query: str, params: dict) -> list[dict]:
 class TestGraph:
     def test_graph_data_shape(self, client, fake_neo4j):
         def handler(query, params):
-            if "elementId(n) AS id" in query:
+            if "elementId(n)) AS id" in query:
                 return [
-                    {
-                        "id": "1",
-                        "labels": ["Entity"],
-                        "properties": {"name": "Ada", "type": "PERSON"},
-                    }
+                    _project_node(
+                        {
+                            "id": "1",
+                            "labels": ["Entity"],
+                            "properties": {"name": "Ada", "type": "PERSON"},
+                        }
+                    )
                 ]
-            if "elementId(a) AS source" in query:
+            if "elementId(a)) AS source" in query:
                 return [
-                    {"source": "1", "target": "2", "type": "WORKED_ON", "properties": {}}
+                    _project_rel(
+                        {"source": "1", "target": "2", "type": "WORKED_ON", "properties": {}}
+                    )
                 ]
             return []
 
@@ -382,6 +437,59 @@ class TestGraph:
         )
         assert "MATCH (a:Entity)-[r]->(b:Entity)" in calls[1][0]
 
+    def test_graph_data_pagination_covers_every_link_exactly_once(
+        self, client, fake_neo4j
+    ):
+        nodes = [
+            {"id": str(i), "labels": ["Entity"], "properties": {"name": f"N{i}", "type": "T"}}
+            for i in range(4)
+        ]
+        rels = [
+            {"source": "0", "target": "1", "type": "R", "properties": {}},
+            {"source": "1", "target": "2", "type": "R", "properties": {}},
+            {"source": "2", "target": "0", "type": "R", "properties": {}},
+        ]
+
+        def handler(query, params):
+            if "elementId(n)) AS id" in query:
+                ordered = sorted(nodes, key=lambda n: n["properties"]["name"])
+                if "SKIP" in query:
+                    ordered = ordered[params["offset"] : params["offset"] + params["limit"]]
+                return [_project_node(n) for n in ordered]
+            if "elementId(a)) AS source" in query:
+                kept = rels
+                if "$ids" in query:
+                    ids = set(params["ids"])
+                    kept = [r for r in rels if r["source"] in ids]
+                return [_project_rel(r) for r in kept]
+            return []
+
+        calls = fake_neo4j(handler)
+        r = client.get("/api/graph-data", params={"limit": 2})
+        assert r.status_code == 200
+        body = r.json()
+        assert [n["label"] for n in body["nodes"]] == ["N0", "N1"]
+        # Each page carries the links ORIGINATING from its nodes — 1→2 is
+        # allowed to dangle toward page 2 rather than being lost outright.
+        page1_links = [(lk["source"], lk["target"]) for lk in body["links"]]
+        assert page1_links == [("0", "1"), ("1", "2")]
+        # Pagination must not loosen the :Entity scoping.
+        assert "MATCH (n:Entity)" in calls[0][0]
+
+        r2 = client.get("/api/graph-data", params={"limit": 2, "offset": 2})
+        assert [n["label"] for n in r2.json()["nodes"]] == ["N2", "N3"]
+        page2_links = [(lk["source"], lk["target"]) for lk in r2.json()["links"]]
+        assert page2_links == [("2", "0")]
+        # The pages together reassemble the complete edge set, no duplicates.
+        assert sorted(page1_links + page2_links) == sorted(
+            (r["source"], r["target"]) for r in rels
+        )
+
+    def test_graph_data_rejects_bad_pagination(self, client, fake_neo4j):
+        fake_neo4j(lambda q, p: [])
+        assert client.get("/api/graph-data", params={"limit": 0}).status_code == 422
+        assert client.get("/api/graph-data", params={"offset": -1}).status_code == 422
+
     def test_clear_graph(self, client, fake_neo4j):
         fake_neo4j(lambda q, p: [])
         r = client.delete("/api/graph")
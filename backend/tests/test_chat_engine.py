@@ -356,6 +356,93 @@ class TestRetrieval:
         assert citations == []
 
 
+# ── Retrieval cache ──────────────────────────────────────────────────────────
+class TestRetrievalCache:
+    async def test_repeat_question_skips_the_database(self, monkeypatch):
+        calls = {"n": 0}
+
+        async def counting_search(question, k, settings):
+            calls["n"] += 1
+            return chat_engine.Retrieval("CTX", [], [], "local", [])
+
+        monkeypatch.setattr(chat_engine, "_local_search", counting_search)
+
+        first = await retrieve_subgraph("Who is Ada?")
+        second = await retrieve_subgraph("  who is ada?  ")  # normalized key
+        assert calls["n"] == 1
+        assert second is first
+
+    async def test_different_k_is_a_different_entry(self, monkeypatch):
+        calls = {"n": 0}
+
+        async def counting_search(question, k, settings):
+            calls["n"] += 1
+            return chat_engine.Retrieval("CTX", [], [], "local", [])
+
+        monkeypatch.setattr(chat_engine, "_local_search", counting_search)
+        await retrieve_subgraph("Who is Ada?", k=8)
+        await retrieve_subgraph("Who is Ada?", k=4)
+        assert calls["n"] == 2
+
+    async def test_invalidation_forces_a_fresh_retrieval(self, monkeypatch):
+        calls = {"n": 0}
+
+        async def counting_search(question, k, settings):
+            calls["n"] += 1
+            return chat_engine.Retrieval("CTX", [], [], "local", [])
+
+        monkeypatch.setattr(chat_engine, "_local_search", counting_search)
+        await retrieve_subgraph("Who is Ada?")
+        chat_engine.invalidate_retrieval_cache()
+        await retrieve_subgraph("Who is Ada?")
+        assert calls["n"] == 2
+
+    async def test_expired_entries_are_refetched(self, monkeypatch):
+        calls = {"n": 0}
+
+        async def counting_search(question, k, settings):
+            calls["n"] += 1
+            return chat_engine.Retrieval("CTX", [], [], "local", [])
+
+        monkeypatch.setattr(chat_engine, "_local_search", counting_search)
+        await retrieve_subgraph("Who is Ada?")
+
+        now = chat_engine.time.monotonic()
+        ttl = get_settings().retrieval_cache_ttl_seconds
+        monkeypatch.setattr(chat_engine.time, "monotonic", lambda: now + ttl + 1)
+        await retrieve_subgraph("Who is Ada?")
+        assert calls["n"] == 2
+
+    async def test_zero_ttl_disables_caching(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "retrieval_cache_ttl_seconds", 0.0, raising=False)
+        calls = {"n": 0}
+
+        async def counting_search(question, k, settings):
+            calls["n"] += 1
+            return chat_engine.Retrieval("CTX", [], [], "local", [])
+
+        monkeypatch.setattr(chat_engine, "_local_search", counting_search)
+        await retrieve_subgraph("Who is Ada?")
+        await retrieve_subgraph("Who is Ada?")
+        assert calls["n"] == 2
+        assert chat_engine._retrieval_cache == {}
+
+    async def test_cache_is_bounded_lru(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "retrieval_cache_max_entries", 2, raising=False)
+
+        async def search(question, k, settings):
+            return chat_engine.Retrieval(question, [], [], "local", [])
+
+        monkeypatch.setattr(chat_engine, "_local_search", search)
+        for question in ("q1", "q2", "q3"):
+            await retrieve_subgraph(question)
+        assert len(chat_engine._retrieval_cache) == 2
+        cached_questions = {key[0] for key in chat_engine._retrieval_cache}
+        assert cached_questions == {"q2", "q3"}
+
+
 # ── Global search ────────────────────────────────────────────────────────────
 COMMUNITIES = [
     {
@@ -749,11 +749,20 @@ class TestChunksNeverLeakIntoTheGraphVisualization:
                 f"unscoped graph-data query would pull in :Chunk nodes: {query}"
             )
             if "MATCH (n:Entity)" in query:
+                # The router projects in Cypher now: only the whitelisted keys
+                # come back, so the embedding vector never leaves the database.
                 return [
                     {
                         "id": "1",
-                        "labels": ["Entity"],
-                        "properties": {"name": "Ahmed", "type": "PERSON", "embedding": [0.1]},
+                        "label": "Ahmed",
+                        "type": "PERSON",
+                        "properties": {
+                            "name": "Ahmed",
+                            "type": "PERSON",
+                            "description": None,
+                            "document": None,
+                            "aliases": None,
+                        },
                     }
                 ]
             return []
@@ -598,11 +598,11 @@ class TestGraphBuilderIntegration:
         assert result["unique_entities"] == 2
         assert result["nodes_created"] == 2
 
-        written = [p["name"] for q, p in calls if "MERGE (n:Entity {name: $name})" in q]
-        assert sorted(written) == ["Ahmed Maaloul", "PostgreSQL"]
+        rows = next(p["rows"] for q, p in calls if "MERGE (n:Entity {name: row.name})" in q)
+        assert sorted(row["name"] for row in rows) == ["Ahmed Maaloul", "PostgreSQL"]
 
         # The absorbed names are searchable as aliases on the surviving node.
-        aliases = {p["name"]: p["aliases"] for q, p in calls if "MERGE (n:Entity" in q}
+        aliases = {row["name"]: row["aliases"] for row in rows}
         assert aliases["Ahmed Maaloul"] == ["Ahmed"]
         assert aliases["PostgreSQL"] == ["Postgres"]
 
@@ -618,7 +618,10 @@ class TestGraphBuilderIntegration:
         await graph_builder.build_knowledge_graph(["Ahmed uses Postgres."], "cv.pdf")
 
         edges = {
-            (p["source"], p["target"]) for q, p in calls if "apoc.merge.relationship" in q
+            (row["source"], row["target"])
+            for q, p in calls
+            if "apoc.merge.relationship" in q
+            for row in p["rows"]
         }
         # Both extracted edges now point at the canonical nodes, and the
         # Ahmed -> Ahmed Maaloul edge became a self-loop and was dropped.
@@ -631,7 +634,10 @@ class TestGraphBuilderIntegration:
         await graph_builder.build_knowledge_graph(["Ahmed uses Postgres."], "cv.pdf")
 
         descriptions = {
-            p["name"]: p["description"] for q, p in calls if "MERGE (n:Entity" in q
+            row["name"]: row["description"]
+            for q, p in calls
+            if "MERGE (n:Entity" in q
+            for row in p["rows"]
         }
         # "PostgreSQL" was extracted without one; it inherits "Postgres"'s.
         assert descriptions["PostgreSQL"] == "relational database"
@@ -646,8 +652,10 @@ class TestGraphBuilderIntegration:
 
         assert result["entities_merged"] == 0
         assert result["unique_entities"] == 4
-        written = [p["name"] for q, p in calls if "MERGE (n:Entity {name: $name})" in q]
-        assert sorted(written) == ["Ahmed", "Ahmed Maaloul", "PostgreSQL", "Postgres"]
+        rows = next(p["rows"] for q, p in calls if "MERGE (n:Entity {name: row.name})" in q)
+        assert sorted(row["name"] for row in rows) == [
+            "Ahmed", "Ahmed Maaloul", "PostgreSQL", "Postgres"
+        ]
 
     async def test_merges_against_entities_from_earlier_documents(self, fake_neo4j):
         """A fresh "PostgreSQL" must absorb the "Postgres" written by a previous ingest."""
@@ -671,6 +679,23 @@ class TestGraphBuilderIntegration:
         apoc = [p for q, p in calls if "apoc.refactor.mergeNodes" in q]
         assert apoc == [{"canonical": "PostgreSQL", "dups": ["Postgres"]}]
 
+    async def test_prefetched_snapshot_skips_the_graph_fetch(self, fake_neo4j):
+        """With a snapshot supplied, resolution issues no read of its own."""
+        calls = fake_neo4j(lambda q, p: [])
+
+        merged = await graph_builder._resolve_against_graph(
+            [{"name": "PostgreSQL", "type": "TOOL"}],
+            {"PostgreSQL": SAME},
+            _settings(),
+            snapshot=([{"name": "Postgres", "type": "TOOL"}], {"Postgres": SAME}),
+        )
+
+        assert merged == 1
+        assert not any(
+            "RETURN n.name AS name, n.type AS type, n.embedding AS embedding" in q
+            for q, _ in calls
+        )
+
     async def test_graph_pass_ignores_clusters_without_a_fresh_entity(self, fake_neo4j):
         """Two old duplicates unrelated to this document are left alone."""
 
@@ -3,10 +3,13 @@
 # Synapse — https://github.com/ahmedmaaloul/synapse
 """Tests for extraction parsing, dedup, and the ingest orchestration."""
 
+import asyncio
 
+from app.config import get_settings
 from app.services import graph_builder
 from app.services.graph_builder import (
     _dedupe_entities,
+    _dedupe_relationships,
     _parse_llm_json,
     get_extraction_prompt,
 )
@@ -56,6 +59,42 @@ class TestDedupe:
         out = _dedupe_entities([{"name": "A"}, {"name": "B"}])
         assert len(out) == 2
 
+    def test_collapses_unicode_presentation_variants(self):
+        entities = [
+            {"name": "Résumé"},  # composed accents
+            {"name": "Résumé"},  # decomposed accents
+            {"name": "RÉSUMÉ"},
+        ]
+        assert len(_dedupe_entities(entities)) == 1
+
+
+class TestDedupeRelationships:
+    def test_collapses_identical_triples_across_chunks(self):
+        rels = [
+            {"source": "Ada", "target": "Engine", "type": "WORKED_ON", "description": "a"},
+            {"source": "ada", "target": "ENGINE", "type": "worked on", "description": "b"},
+        ]
+        out = _dedupe_relationships(rels)
+        assert len(out) == 1  # last one wins
+        assert out[0]["description"] == "b"
+
+    def test_distinct_types_between_same_nodes_are_kept(self):
+        rels = [
+            {"source": "Ada", "target": "Engine", "type": "WORKED_ON"},
+            {"source": "Ada", "target": "Engine", "type": "DESIGNED"},
+        ]
+        assert len(_dedupe_relationships(rels)) == 2
+
+    def test_direction_matters(self):
+        rels = [
+            {"source": "A", "target": "B", "type": "PART_OF"},
+            {"source": "B", "target": "A", "type": "PART_OF"},
+        ]
+        assert len(_dedupe_relationships(rels)) == 2
+
+    def test_drops_rels_missing_an_endpoint(self):
+        assert _dedupe_relationships([{"source": "A", "target": " "}]) == []
+
 
 class TestPromptSchema:
     def test_theme_specific_types_present(self):
@@ -64,6 +103,15 @@ class TestPromptSchema:
         assert "DISEASE" in rendered
         assert "TREATS" in rendered
 
+    def test_prompt_is_built_once_per_theme(self):
+        # The template is a pure function of the theme; repeated ingests must
+        # reuse the compiled object instead of re-parsing the prompt string.
+        assert get_extraction_prompt("Generic") is get_extraction_prompt("Generic")
+
+    def test_every_theme_is_prebuilt_at_import(self):
+        # A broken template must fail at startup, not on the first upload.
+        assert set(graph_builder.EXTRACTION_PROMPTS) == set(graph_builder.THEMES)
+
     def test_unknown_theme_falls_back_to_generic(self):
         prompt = get_extraction_prompt("Nonexistent Theme")
         rendered = prompt.format(text="t", theme="x", document_name="d")
@@ -107,6 +155,86 @@ class TestBuildKnowledgeGraph:
         assert "extracting" in stages
         assert "writing_nodes" in stages
 
+    async def test_worker_pool_bounds_concurrency_and_preserves_order(
+        self, monkeypatch, fake_neo4j
+    ):
+        fake_neo4j(lambda q, p: [])
+        settings = get_settings()
+        monkeypatch.setattr(settings, "extraction_concurrency", 2, raising=False)
+
+        running = 0
+        peak = 0
+
+        async def fake_extract(chain, chunk, idx, *, timeout, theme, document_name):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"entities": [{"name": f"E{idx}"}], "relationships": []}
+
+        monkeypatch.setattr(graph_builder, "_extract_with_timeout", fake_extract)
+        monkeypatch.setattr(graph_builder, "get_chat_llm", lambda **kw: object())
+        monkeypatch.setattr(
+            graph_builder, "get_extraction_prompt", lambda theme: _PipeStub()
+        )
+
+        captured = {}
+
+        async def fake_store(document, chunks, names):
+            captured["names"] = names
+            return {"chunks": len(chunks), "links": 0}
+
+        monkeypatch.setattr(graph_builder.chunk_store, "store_chunks", fake_store)
+
+        result = await graph_builder.build_knowledge_graph(
+            [f"chunk {i}" for i in range(6)], "d.pdf"
+        )
+        assert peak <= 2  # never more in-flight extractions than workers
+        # Results land in their chunk's slot: the per-chunk entity lists keep
+        # document order however the workers interleaved.
+        assert captured["names"] == [[f"E{i + 1}"] for i in range(6)]
+        assert result["unique_entities"] == 6
+
+    async def test_failed_ingest_cancels_the_snapshot_prefetch(
+        self, monkeypatch, fake_neo4j
+    ):
+        # The whole-graph snapshot loads concurrently with extraction; an
+        # ingest that dies before consuming it must cancel it rather than
+        # leave the read running (and its exception unretrieved) behind a
+        # failure.
+        import pytest
+
+        fake_neo4j(lambda q, p: [])
+        settings = get_settings()
+        monkeypatch.setattr(settings, "entity_resolution_enabled", True, raising=False)
+
+        cancelled = asyncio.Event()
+
+        async def slow_snapshot():
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        monkeypatch.setattr(
+            graph_builder.entity_resolution, "fetch_graph_entities", slow_snapshot
+        )
+        monkeypatch.setattr(graph_builder, "get_chat_llm", lambda **kw: object())
+        monkeypatch.setattr(
+            graph_builder, "get_extraction_prompt", lambda theme: _PipeStub()
+        )
+
+        async def boom(entities):
+            raise RuntimeError("embedding backend down")
+
+        monkeypatch.setattr(graph_builder, "_embed_entities", boom)
+
+        with pytest.raises(RuntimeError, match="embedding backend down"):
+            await graph_builder.build_knowledge_graph(["some text"], "d.pdf")
+        assert cancelled.is_set()
+
 
 class _PipeStub:
     """Stands in for a ChatPromptTemplate so `prompt | llm` yields a fake chain."""
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (c) 2026 Ahmed Maaloul <ahmed.maaloul@proton.me>
+# Synapse — https://github.com/ahmedmaaloul/synapse
+"""Tests for the startup schema bootstrap.
+
+Every MERGE/MATCH in the write and retrieval paths keys on ``Entity.name``;
+without the uniqueness constraint's backing index each one is a label scan, so
+ingest cost would grow with the size of the graph. These tests pin the
+constraint and the retrieval indexes so a schema refactor cannot silently drop
+them.
+"""
+
+from app.services.graph_schema import (
+    CHUNK_ID_CONSTRAINT,
+    ENTITY_FULLTEXT_INDEX,
+    ENTITY_NAME_CONSTRAINT,
+    ENTITY_VECTOR_INDEX,
+    ensure_schema,
+)
+
+
+class TestEnsureSchema:
+    async def test_creates_entity_name_uniqueness_constraint(self, fake_neo4j):
+        calls = fake_neo4j(lambda q, p: [])
+        await ensure_schema()
+
+        constraint = next(q for q, _ in calls if ENTITY_NAME_CONSTRAINT in q)
+        assert "IF NOT EXISTS" in constraint
+        assert "REQUIRE n.name IS UNIQUE" in constraint
+
+    async def test_creates_chunk_id_uniqueness_constraint(self, fake_neo4j):
+        calls = fake_neo4j(lambda q, p: [])
+        await ensure_schema()
+
+        constraint = next(q for q, _ in calls if CHUNK_ID_CONSTRAINT in q)
+        assert "REQUIRE c.id IS UNIQUE" in constraint
+
+    async def test_creates_retrieval_indexes(self, fake_neo4j):
+        calls = fake_neo4j(lambda q, p: [])
+        await ensure_schema()
+
+        queries = [q for q, _ in calls]
+        fulltext = next(q for q in queries if ENTITY_FULLTEXT_INDEX in q)
+        assert "n.name" in fulltext and "n.description" in fulltext
+        assert any(ENTITY_VECTOR_INDEX in q for q in queries)
+
+    async def test_every_statement_is_idempotent(self, fake_neo4j):
+        calls = fake_neo4j(lambda q, p: [])
+        await ensure_schema()
+        assert all("IF NOT EXISTS" in q for q, _ in calls)
+
+    async def test_one_failing_statement_does_not_abort_the_rest(self, fake_neo4j):
+        def old_neo4j(query: str, params: dict):
+            if "VECTOR INDEX" in query:
+                raise RuntimeError("Unsupported administration command")
+            return []
+
+        calls = fake_neo4j(old_neo4j)
+        await ensure_schema()  # must not raise
+
+        # The constraint (and with it the name index) still went through.
+        assert any(ENTITY_NAME_CONSTRAINT in q for q, _ in calls)
+        assert any(ENTITY_FULLTEXT_INDEX in q for q, _ in calls)
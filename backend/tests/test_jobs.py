@@ -39,3 +39,31 @@ class TestJobBus:
         await bus.publish(job_id, {"type": "done", "data": {}})
         _ = [e async for e in bus.subscribe(job_id)]
         assert bus.get(job_id) is None
+
+
+class TestJobBusEviction:
+    async def test_finished_jobs_evicted_first(self):
+        bus = JobBus(max_jobs=3)
+        finished = bus.create()
+        await bus.publish(finished, {"type": "done", "data": {}})
+        live = [bus.create(), bus.create()]
+
+        newest = bus.create()  # at capacity: evicts the finished job
+        assert bus.get(finished) is None
+        for job_id in [*live, newest]:
+            assert bus.get(job_id) is not None
+
+    def test_oldest_dropped_when_all_unfinished(self):
+        bus = JobBus(max_jobs=2)
+        oldest = bus.create()
+        second = bus.create()
+        newest = bus.create()
+        assert bus.get(oldest) is None
+        assert bus.get(second) is not None
+        assert bus.get(newest) is not None
+
+    def test_registry_stays_bounded(self):
+        bus = JobBus(max_jobs=5)
+        for _ in range(50):
+            bus.create()
+        assert len(bus._jobs) <= 5
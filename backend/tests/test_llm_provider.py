@@ -304,6 +304,26 @@ class TestOpenAICompatibleBranch:
         assert llm.openai_api_key.get_secret_value() == "sk-test-not-a-real-key"
 
 
+class TestChatClientReuse:
+    """One client per (config, options) combination — never one per request."""
+
+    def test_same_options_reuse_the_same_client(self):
+        pytest.importorskip("langchain_ollama")
+        s = Settings(llm_provider="ollama")
+        assert get_chat_llm(settings=s) is get_chat_llm(settings=s)
+
+    def test_different_options_get_their_own_client(self):
+        pytest.importorskip("langchain_ollama")
+        s = Settings(llm_provider="ollama")
+        assert get_chat_llm(settings=s) is not get_chat_llm(settings=s, json_mode=True)
+
+    def test_different_config_gets_its_own_client(self):
+        pytest.importorskip("langchain_ollama")
+        a = get_chat_llm(settings=Settings(llm_provider="ollama", ollama_chat_model="mistral"))
+        b = get_chat_llm(settings=Settings(llm_provider="ollama", ollama_chat_model="llama3"))
+        assert a is not b
+
+
 class TestProviderRegistryStaysInSync:
     """Guard against adding a provider to one list but not the other."""
 
@@ -3,7 +3,7 @@
 # Synapse — https://github.com/ahmedmaaloul/synapse
 """Tests for the deterministic chunking logic."""
 
-from app.services.pdf_parser import chunk_text
+from app.services.pdf_parser import _chunks_from_pages, chunk_text
 
 
 def test_empty_and_whitespace_return_no_chunks():
@@ -47,3 +47,88 @@ def test_invalid_chunk_size_raises():
 
     with pytest.raises(ValueError):
         chunk_text("hello", chunk_size=0)
+    with pytest.raises(ValueError):
+        list(_chunks_from_pages(["hello"], chunk_size=0))
+
+
+def test_streaming_pages_chunk_like_the_joined_text():
+    pages = [
+        "First page sentence one. First page sentence two.",
+        "Second page starts here. It keeps going with more prose.",
+        "",  # a page pypdf extracted nothing from
+        "Third page wraps the document up.",
+    ]
+    joined = "\n".join(p for p in pages if p)
+    assert (
+        list(_chunks_from_pages(pages, chunk_size=40, overlap=10))
+        == chunk_text(joined, chunk_size=40, overlap=10)
+    )
+
+
+def test_many_pages_accumulate_linearly_and_chunk_identically():
+    # Regression guard for the old `full_text += page + "\n"` accumulation:
+    # the rolling buffer must keep producing exactly what chunking the joined
+    # document would, while never holding more than one window plus one page.
+    pages = [f"Sentence {i} of page {i} ends here. More prose follows it." for i in range(200)]
+    streamed = list(_chunks_from_pages(iter(pages), chunk_size=150, overlap=30))
+    joined = chunk_text("\n".join(pages), chunk_size=150, overlap=30)
+    assert streamed == joined
+    assert len(streamed) > 50  # the input genuinely spans many windows
+
+
+def test_page_text_iteration_accepts_bytes_and_streams():
+    # One blank page round-tripped through whichever extractor is active
+    # (PDFium when installed, pypdf otherwise) — both input forms must work.
+    import io
+
+    from pypdf import PdfWriter
+
+    from app.services.pdf_parser import _iter_page_texts
+
+    writer = PdfWriter()
+    writer.add_blank_page(200, 200)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+
+    assert list(_iter_page_texts(buffer.getvalue())) == [""]
+    buffer.seek(0)
+    assert list(_iter_page_texts(buffer)) == [""]
+
+
+def test_pdfium_iteration_holds_the_module_lock():
+    # PDFium is not thread-safe and uploads parse on worker threads: the lock
+    # must be held for the whole page iteration and dropped when it ends.
+    import io
+
+    import pytest
+    from pypdf import PdfWriter
+
+    from app.services import pdf_parser
+
+    if pdf_parser.pdfium is None:
+        pytest.skip("pypdfium2 not installed")
+
+    writer = PdfWriter()
+    writer.add_blank_page(200, 200)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+
+    pages = pdf_parser._iter_page_texts(buffer.getvalue())
+    next(pages)  # suspended mid-iteration
+    assert pdf_parser._PDFIUM_LOCK.locked()
+    pages.close()
+    assert not pdf_parser._PDFIUM_LOCK.locked()
+
+
+def test_streaming_yields_before_later_pages_are_read():
+    consumed: list[int] = []
+
+    def pages():
+        for i in range(3):
+            consumed.append(i)
+            yield f"Page {i} text. " * 20
+
+    stream = _chunks_from_pages(pages(), chunk_size=100, overlap=20)
+    next(stream)
+    # The first chunk fits inside page 0, so pages 1-2 are still unparsed.
+    assert consumed == [0]
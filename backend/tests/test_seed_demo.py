@@ -216,10 +216,13 @@ class TestSeed:
         assert result["relationships_in_file"] == len(payload["relationships"])
         assert result["cleared"] is False
 
-        merges = [q for q, _ in calls if "MERGE (n:Entity {name: $name})" in q]
-        assert len(merges) == len(payload["entities"])
-        apoc = [q for q, _ in calls if "apoc.merge.relationship" in q]
-        assert len(apoc) == len(payload["relationships"])
+        # Writes are batched: one UNWIND per phase, carrying every row.
+        merges = [p for q, p in calls if "MERGE (n:Entity {name: row.name})" in q]
+        assert len(merges) == 1
+        assert len(merges[0]["rows"]) == len(payload["entities"])
+        apoc = [p for q, p in calls if "apoc.merge.relationship" in q]
+        assert len(apoc) == 1
+        assert len(apoc[0]["rows"]) == len(payload["relationships"])
 
         assert "Demo graph:" in capsys.readouterr().out
 
@@ -241,14 +244,14 @@ class TestSeed:
         result = await seed_demo.seed(payload, echo=False)
 
         assert result["embedded"] == len(payload["entities"])
-        node_params = [p for q, p in calls if "MERGE (n:Entity {name: $name})" in q]
-        assert all(p["embedding"] for p in node_params)
-        assert len(node_params[0]["embedding"]) == 384
+        node_rows = next(p["rows"] for q, p in calls if "MERGE (n:Entity {name: row.name})" in q)
+        assert all(row["embedding"] for row in node_rows)
+        assert len(node_rows[0]["embedding"]) == 384
 
     async def test_stores_document_name_on_every_node(self, fake_neo4j):
         calls = fake_neo4j(_handler)
         await seed_demo.seed(_valid_payload(), document_name="My Demo", echo=False)
-        node_params = [p for q, p in calls if "MERGE (n:Entity {name: $name})" in q]
+        node_params = [p for q, p in calls if "MERGE (n:Entity {name: row.name})" in q]
         assert {p["document"] for p in node_params} == {"My Demo"}
 
     async def test_clear_flag_wipes_first(self, fake_neo4j):
@@ -277,7 +280,9 @@ class TestSeed:
         result = await seed_demo.seed(_valid_payload(), echo=False)
 
         assert result["relationships_created"] == 1
-        assert any("MERGE (a)-[r:RELATED_TO]->(b)" in q for q, _ in calls)
+        # The APOC-less path still writes the semantic type, interpolated after
+        # validation rather than passed to apoc.merge.relationship.
+        assert any("MERGE (a)-[r:WROTE_PROGRAM_FOR]->(b)" in q for q, _ in calls)
 
 
 class TestClearCoversEveryLabelSynapseWrites: